@@ -1,39 +1,132 @@
-# Heidolph
-from .devices.heidolph_hei_torque_100_precision import HeiTorque100PrecisionStirrer
-from .devices.heidolph_rzr_2052_control import RZR2052ControlStirrer
+"""PyLabware - a library to control common chemical laboratory hardware.
 
-# Huber
-from .devices.huber_petite_fleur import PetiteFleurChiller
+Device driver classes are exposed in the package namespace, but the
+corresponding driver modules are only imported on first access. dir() and
+tab completion list the device classes without importing them, while any
+actual use, e.g. help(PyLabware.XLP6000SyringePump), imports the driver module
+of that device only.
 
-# Buchi
-from .devices.buchi_r300 import R300Rotovap
-from .devices.buchi_c815 import C815FlashChromatographySystem
+Importing the package doesn't configure logging. Loggers are only created
+with the device objects, and setting up handlers is left to the application.
+"""
 
-# IDEX
-from .devices.idex_mxii import IDEXMXIIValve
+import importlib
 
-# IKA
-from .devices.ika_microstar_75 import Microstar75Stirrer
-from .devices.ika_rct_digital import RCTDigitalHotplate
-from .devices.ika_ret_control_visc import RETControlViscHotplate
-from .devices.ika_rv10 import RV10Rotovap
+# Device classes and the driver modules providing them.
+# Regenerate with utils/lazy_map_generator.py when adding a new device.
+from ._lazy_map import LAZY_MAP as _LAZY
+from . import _finder, _lazy
+from .exceptions import PLDeviceError
 
-# JULABO
-from .devices.julabo_cf41 import CF41Chiller
-# Kern
-from .devices.kern_kdp3000 import KDP3000Balance
+# Resolve the driver module imports from the lazy import table
+# before any of them can be triggered by __getattr__ below
+_finder.install()
 
-# Mettler Toledo
-from .devices.mt_ms3002s import MS3002SBalance
+# Device models and the classes implementing them, for open_device()
+_MODELS = {
+    "HeiTorque100Precision": "HeiTorque100PrecisionStirrer",
+    "RZR2052Control": "RZR2052ControlStirrer",
+    "PetiteFleur": "PetiteFleurChiller",
+    "R300": "R300Rotovap",
+    "C815": "C815FlashChromatographySystem",
+    "MXII": "IDEXMXIIValve",
+    "Microstar75": "Microstar75Stirrer",
+    "RCT_digital": "RCTDigitalHotplate",
+    "RET_control_visc": "RETControlViscHotplate",
+    "RV10": "RV10Rotovap",
+    "CF41": "CF41Chiller",
+    "KDP3000": "KDP3000Balance",
+    "MS3002S": "MS3002SBalance",
+    "781pH": "Metrohm781pHMeter",
+    "XLP6000": "XLP6000SyringePump",
+    "C3000": "C3000SyringePump",
+    "CVC3000": "CVC3000VacuumPump",
+}
+# Driver modules are taken from the lazy import table, so that both stay in sync
+_REGISTRY = {model: (_LAZY[class_name], class_name) for model, class_name in _MODELS.items()}
 
-# Metrohm
-from .devices.metrohm_781ph import Metrohm781pHMeter
+# Core submodules, previously available as attributes after the package import
+_SUBMODULES = ["connections", "controllers", "devices", "discovery", "exceptions", "models", "parsers"]
 
-# TECAN
-from .devices.tecan_cavro_xlp6000 import XLP6000SyringePump
+# Vendor namespaces, e.g. "from PyLabware.ika import RCTDigitalHotplate"
+_VENDORS = ["buchi", "heidolph", "huber", "idex", "ika", "julabo", "kern", "mettler_toledo",
+            "metrohm", "tecan", "tricontinent", "vacuubrand"]
 
-# Tricontinent
-from .devices.tricontinent_c3000 import C3000SyringePump
+# Helper functions and the modules providing them
+_LAZY_FUNCTIONS = {
+    "scan": ".discovery",
+}
 
-# Vacuubrand
-from .devices.vacuubrand_cvc_3000 import CVC3000VacuumPump
+__all__ = sorted(list(_LAZY) + _SUBMODULES + _VENDORS + ["open_device"] + list(_LAZY_FUNCTIONS))
+
+# Entry point group for device drivers provided by other packages,
+# the bundled drivers are always resolved through _LAZY
+_DRIVERS_ENTRY_POINT_GROUP = "pylabware.drivers"
+# Cache of the entry points found, filled in on first use
+_entry_points_cache = None
+
+
+def _driver_entry_points():
+    """Returns the device drivers registered as entry points, reading
+    the packaging metadata only once.
+    """
+
+    global _entry_points_cache
+    if _entry_points_cache is None:
+        from importlib.metadata import entry_points
+        eps = entry_points()
+        # Python < 3.10 returns a dictionary of groups
+        if hasattr(eps, "select"):
+            eps = eps.select(group=_DRIVERS_ENTRY_POINT_GROUP)
+        else:
+            eps = eps.get(_DRIVERS_ENTRY_POINT_GROUP, [])
+        _entry_points_cache = {ep.name: ep for ep in eps}
+    return _entry_points_cache
+
+
+def open_device(model: str, *args, **kwargs):
+    """Creates a device object for the model provided, importing only the
+    driver module required.
+
+    Args:
+        model: Device model name, see _MODELS for the list of supported models.
+        args, kwargs: Positional and keyword arguments for the device class constructor.
+
+    Returns:
+        (LabDevice): Device object.
+    """
+
+    try:
+        module_name, class_name = _REGISTRY[model]
+    except KeyError:
+        raise PLDeviceError(f"Unknown device model <{model}>! Supported models are: {', '.join(_REGISTRY)}") from None
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)(*args, **kwargs)
+
+
+def __getattr__(name):
+    """Imports the driver module providing the requested class on first access (PEP 562)."""
+
+    if name in _SUBMODULES or name in _VENDORS:
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY:
+        module_name = _LAZY[name]
+    elif name in _LAZY_FUNCTIONS:
+        module_name = _LAZY_FUNCTIONS[name]
+    else:
+        # Private and dunder names are never drivers, and are often probed
+        # by tools like pickle or IPython, so don't scan the entry points for them
+        if name.startswith("_"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        # Look up drivers registered by other packages
+        ep = _driver_entry_points().get(name)
+        if ep is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        return _lazy.resolve(__name__, name, ep.load)
+    return _lazy.resolve(__name__, name, lambda: getattr(importlib.import_module(module_name, __name__), name))
+
+
+def __dir__():
+    # Only the static list of public names, so that completion
+    # in the interactive shells doesn't trigger any imports
+    return __all__
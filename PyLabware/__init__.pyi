@@ -0,0 +1,98 @@
+"""Type stub for the lazily loaded PyLabware namespace.
+
+Static analyzers read the eager imports below, while at runtime device
+modules are imported on first access by __getattr__ in __init__.py.
+Keep the two files in sync when adding a new device.
+"""
+
+from typing import Any
+
+from . import connections, controllers, devices, discovery, exceptions, models, parsers
+from . import (buchi, heidolph, huber, idex, ika, julabo, kern, mettler_toledo, metrohm, tecan,
+               tricontinent, vacuubrand)
+from .controllers import LabDevice
+from .discovery import scan
+
+# Heidolph
+from .devices.heidolph_hei_torque_100_precision import HeiTorque100PrecisionStirrer
+from .devices.heidolph_rzr_2052_control import RZR2052ControlStirrer
+
+# Huber
+from .devices.huber_petite_fleur import PetiteFleurChiller
+
+# Buchi
+from .devices.buchi_r300 import R300Rotovap
+from .devices.buchi_c815 import C815FlashChromatographySystem
+
+# IDEX
+from .devices.idex_mxii import IDEXMXIIValve
+
+# IKA
+from .devices.ika_microstar_75 import Microstar75Stirrer
+from .devices.ika_rct_digital import RCTDigitalHotplate
+from .devices.ika_ret_control_visc import RETControlViscHotplate
+from .devices.ika_rv10 import RV10Rotovap
+
+# JULABO
+from .devices.julabo_cf41 import CF41Chiller
+
+# Kern
+from .devices.kern_kdp3000 import KDP3000Balance
+
+# Mettler Toledo
+from .devices.mt_ms3002s import MS3002SBalance
+
+# Metrohm
+from .devices.metrohm_781ph import Metrohm781pHMeter
+
+# TECAN
+from .devices.tecan_cavro_xlp6000 import XLP6000SyringePump
+
+# Tricontinent
+from .devices.tricontinent_c3000 import C3000SyringePump
+
+# Vacuubrand
+from .devices.vacuubrand_cvc_3000 import CVC3000VacuumPump
+
+def open_device(model: str, *args: Any, **kwargs: Any) -> LabDevice: ...
+
+__all__ = [
+    "HeiTorque100PrecisionStirrer",
+    "RZR2052ControlStirrer",
+    "PetiteFleurChiller",
+    "R300Rotovap",
+    "C815FlashChromatographySystem",
+    "IDEXMXIIValve",
+    "Microstar75Stirrer",
+    "RCTDigitalHotplate",
+    "RETControlViscHotplate",
+    "RV10Rotovap",
+    "CF41Chiller",
+    "KDP3000Balance",
+    "MS3002SBalance",
+    "Metrohm781pHMeter",
+    "XLP6000SyringePump",
+    "C3000SyringePump",
+    "CVC3000VacuumPump",
+    "connections",
+    "controllers",
+    "devices",
+    "discovery",
+    "exceptions",
+    "models",
+    "parsers",
+    "buchi",
+    "heidolph",
+    "huber",
+    "idex",
+    "ika",
+    "julabo",
+    "kern",
+    "metrohm",
+    "mettler_toledo",
+    "tecan",
+    "tricontinent",
+    "vacuubrand",
+    "open_device",
+    "scan",
+]
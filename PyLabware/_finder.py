@@ -0,0 +1,55 @@
+"""Import finder for the PyLabware device driver modules.
+
+The set of driver modules is known in advance from the lazy import table,
+so their specs can be built directly instead of going through the generic
+path based finders for each driver imported.
+"""
+
+import importlib.abc
+import importlib.util
+import os
+import sys
+
+from ._lazy_map import LAZY_MAP
+
+PACKAGE_NAME = __name__.rpartition(".")[0]
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class FrozenPylabwareFinder(importlib.abc.MetaPathFinder):
+    """Finds PyLabware device driver modules by a lookup in a precomputed
+    table of module names and source file paths.
+    """
+
+    def __init__(self, package_name: str, package_dir: str):
+        # Key - full module name, value - path to the module source file
+        self.modules = {package_name + module: os.path.join(package_dir, *module.split(".")[1:]) + ".py"
+                        for module in set(LAZY_MAP.values())}
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Returns the module spec for a known driver module, or None
+        to let the other finders handle any other module or a missing source file.
+        """
+
+        file_path = self.modules.get(fullname)
+        # Fall through to the generic finders if the source is not there,
+        # e.g. for a bytecode-only installation
+        if file_path is None or not os.path.isfile(file_path):
+            return None
+        return importlib.util.spec_from_file_location(fullname, file_path)
+
+    def invalidate_caches(self):
+        pass
+
+
+def install():
+    """Puts the finder in front of sys.meta_path. Does nothing if the package
+    is not imported from a regular directory (e.g. from a zip archive)
+    or if the finder is already installed.
+    """
+
+    if not os.path.isdir(PACKAGE_DIR):
+        return
+    if any(isinstance(finder, FrozenPylabwareFinder) for finder in sys.meta_path):
+        return
+    sys.meta_path.insert(0, FrozenPylabwareFinder(PACKAGE_NAME, PACKAGE_DIR))
@@ -0,0 +1,88 @@
+"""Helpers for lazy import of the device driver modules."""
+
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from ._lazy_map import LAZY_MAP
+
+# Lock protecting the dictionary of names being resolved
+_resolve_lock = threading.Lock()
+# Names being resolved. Key - (module name, attribute name), value - event set when done
+_resolving: Dict[Tuple[str, str], threading.Event] = {}
+
+
+def resolve(module_name: str, name: str, loader: Callable[[], Any]) -> Any:
+    """Resolves a lazily imported name and caches it in the module globals.
+    Thread-safe - if several threads request the same name simultaneously,
+    the loader runs only once and the other threads wait for its result.
+    The lock is not held while the loader runs, as the import it does might
+    in turn need to resolve other names.
+
+    Args:
+        module_name: Name of the module the attribute is requested from.
+        name: Attribute name.
+        loader: Function returning the object for the name.
+
+    Returns:
+        (Any): Object resolved.
+    """
+
+    module_globals = sys.modules[module_name].__dict__
+    key = (module_name, name)
+    while True:
+        with _resolve_lock:
+            if name in module_globals:
+                return module_globals[name]
+            event = _resolving.get(key)
+            if event is None:
+                event = _resolving[key] = threading.Event()
+                break
+        # Another thread is resolving this name. Once it's done, the name is
+        # either in the module globals, or the loader failed and we retry.
+        event.wait()
+    try:
+        obj = loader()
+        with _resolve_lock:
+            # Cache in module globals so that further lookups bypass __getattr__
+            module_globals[name] = obj
+        return obj
+    finally:
+        with _resolve_lock:
+            del _resolving[key]
+        event.set()
+
+
+def attach(module_name: str, lazy_map: Dict[str, str]) -> Tuple[Callable, Callable, List[str]]:
+    """Makes module-level __getattr__ and __dir__ (PEP 562) importing
+    the names from lazy_map on first access.
+
+    Args:
+        module_name: Name of the module to attach to.
+        lazy_map: Mapping of names to the modules providing them, relative to the PyLabware package.
+
+    Returns:
+        (tuple): __getattr__, __dir__ and __all__ for the module.
+    """
+
+    names = list(lazy_map)
+
+    def __getattr__(name):
+        if name not in lazy_map:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return resolve(module_name, name, lambda: getattr(importlib.import_module(lazy_map[name], __package__), name))
+
+    def __dir__():
+        return names
+
+    return __getattr__, __dir__, names
+
+
+def attach_vendor(module_name: str, module_prefix: str) -> Tuple[Callable, Callable, List[str]]:
+    """Attaches lazy imports of all the devices of a single vendor,
+    i.e. the devices whose driver module names start with module_prefix.
+    """
+
+    return attach(module_name, {name: module for name, module in LAZY_MAP.items()
+                                if module.startswith(".devices." + module_prefix)})
@@ -0,0 +1,24 @@
+"""Device classes and the driver modules providing them.
+
+!!! THIS FILE IS AUTO-GENERATED BY utils/lazy_map_generator.py, DO NOT EDIT !!!
+"""
+
+LAZY_MAP = {
+    "C815FlashChromatographySystem": ".devices.buchi_c815",
+    "R300Rotovap": ".devices.buchi_r300",
+    "HeiTorque100PrecisionStirrer": ".devices.heidolph_hei_torque_100_precision",
+    "RZR2052ControlStirrer": ".devices.heidolph_rzr_2052_control",
+    "PetiteFleurChiller": ".devices.huber_petite_fleur",
+    "IDEXMXIIValve": ".devices.idex_mxii",
+    "Microstar75Stirrer": ".devices.ika_microstar_75",
+    "RCTDigitalHotplate": ".devices.ika_rct_digital",
+    "RETControlViscHotplate": ".devices.ika_ret_control_visc",
+    "RV10Rotovap": ".devices.ika_rv10",
+    "CF41Chiller": ".devices.julabo_cf41",
+    "KDP3000Balance": ".devices.kern_kdp3000",
+    "Metrohm781pHMeter": ".devices.metrohm_781ph",
+    "MS3002SBalance": ".devices.mt_ms3002s",
+    "XLP6000SyringePump": ".devices.tecan_cavro_xlp6000",
+    "C3000SyringePump": ".devices.tricontinent_c3000",
+    "CVC3000VacuumPump": ".devices.vacuubrand_cvc_3000",
+}
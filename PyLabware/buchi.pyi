@@ -0,0 +1,4 @@
+from .devices.buchi_c815 import C815FlashChromatographySystem
+from .devices.buchi_r300 import R300Rotovap
+
+__all__ = ["C815FlashChromatographySystem", "R300Rotovap"]
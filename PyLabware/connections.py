@@ -9,9 +9,8 @@ from time import sleep, time
 from urllib.parse import urljoin
 from typing import Any, Dict
 
-import requests
-import serial
-
+# pyserial and requests are imported by the connection adapters only when
+# a connection is actually opened, so that the package import stays cheap.
 from .exceptions import PLConnectionError, PLConnectionProtocolError, PLConnectionTimeoutError
 from .models import LabDeviceReply, ConnectionParameters
 
@@ -154,13 +153,19 @@ class SerialConnection(AbstractConnection):
     SERIAL_DEFAULT_CONNECTION_PARAMETERS = {
         "write_timeout": 0.5,
         "baudrate": 9600,
-        "bytesize": serial.EIGHTBITS,
-        "parity": serial.PARITY_NONE,
-        "stopbits": serial.STOPBITS_ONE,
+        # serial.EIGHTBITS, serial.PARITY_NONE, serial.STOPBITS_ONE
+        "bytesize": 8,
+        "parity": "N",
+        "stopbits": 1,
         "xonxoff": False,
         "rtscts": False,
         "dsrdtr": False,
         "inter_byte_timeout": False,
+        # Set ASYNC_LOW_LATENCY flag on the port (Linux only). For USB-serial
+        # adapters this removes the delay the driver adds before passing
+        # a short reply on (16 ms for FTDI chips). Silently skipped on
+        # other platforms and for port drivers not supporting it.
+        "low_latency": True,
     }  # type: ConnectionParameters
 
     def __init__(self, connection_parameters: ConnectionParameters):
@@ -187,6 +192,8 @@ class SerialConnection(AbstractConnection):
         """Creates, sets up and opens serial connection.
         """
 
+        import serial
+
         if self.is_connection_open():
             self.logger.warning("Connection already open.")
             return
@@ -211,6 +218,14 @@ class SerialConnection(AbstractConnection):
             self._connection.open()
         except serial.SerialException as e:
             raise PLConnectionError(f"Can't open serial port {self._connection.port}!") from e
+        if self.connection_parameters.get("low_latency"):
+            try:
+                self._connection.set_low_latency_mode(True)
+            # AttributeError - no such method for this port class (e.g. on Windows),
+            # NotImplementedError - not supported on this platform (e.g. macOS, BSD),
+            # ValueError - not supported by the port driver
+            except (AttributeError, NotImplementedError, ValueError):
+                self.logger.debug("open_connection()::low latency mode not supported for port <%s>.", self._connection.port)
         # Start connection listener
         self.listener = threading.Thread(target=self.connection_listener, name="{}_listener".format(__name__), daemon=True)
         self._connection_close_requested.clear()
@@ -237,8 +252,10 @@ class SerialConnection(AbstractConnection):
                 while self._connection.in_waiting > 0 and len(self._last_reply) <= self.receive_buffer_size:
                     self.logger.debug("connection_listener()::<%s> bytes to read", self._connection.in_waiting)
                     # Lock connection
+                    # Read only the bytes already received, otherwise read()
+                    # would block until the timeout for a reply shorter than the buffer
                     with self._connection_lock:
-                        reply_bytes = self._connection.read(size=self.receive_buffer_size)
+                        reply_bytes = self._connection.read(size=min(self._connection.in_waiting, self.receive_buffer_size))
                         self.logger.debug("connection_listener()::got reply <%s>", reply_bytes)
                     try:
                         self._last_reply += reply_bytes.decode(self.encoding)
@@ -601,6 +618,8 @@ class HTTPConnection(AbstractConnection):
         """Creates requests.Session() object & sets it's parameters.
         """
 
+        import requests
+
         self._connection = requests.Session()
         if self.user is not None:
             self._connection.auth = (self.user, self.password)
@@ -622,6 +641,8 @@ class HTTPConnection(AbstractConnection):
             message: Dictionary containing method, endpoint and request data
         """
 
+        import requests
+
         # Make complete URL from base API URL and endpoint
         url = urljoin(self.base_url, message["endpoint"])
         self.logger.debug("transmit()::trying to invoke <%s> with method <%s>, data=<%s>", url, message["method"], message["data"])
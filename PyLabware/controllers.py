@@ -5,7 +5,6 @@ import logging
 import threading
 from abc import abstractmethod, ABC
 from functools import wraps
-import sys
 import queue
 from time import sleep
 from typing import Optional, Union, Callable, Any, List, Dict, Tuple
@@ -13,6 +12,7 @@ from typing import Optional, Union, Callable, Any, List, Dict, Tuple
 from .connections import (HTTPConnection, SerialConnection, TCPIPConnection)
 from .exceptions import (PLConnectionError, PLConnectionTimeoutError, PLDeviceError, PLDeviceCommandError, PLDeviceReplyError)
 from .models import (AbstractLabDevice, ConnectionParameters)
+from . import discovery
 from . import parsers as parser
 
 
@@ -81,6 +81,12 @@ class LabDevice(AbstractLabDevice):
     """Base controller class for all labware devices.
     """
 
+    # Device readiness polling in execute_when_ready(), seconds.
+    # The interval starts low to catch short operations finishing early
+    # and grows up to the maximum for the long ones.
+    READY_POLLING_INTERVAL_MIN = 0.05
+    READY_POLLING_INTERVAL_MAX = 0.5
+
     @abstractmethod
     def __init__(self, device_name: str = None, connection_mode: str = None,
                  connection_parameters: ConnectionParameters = None):
@@ -162,34 +168,32 @@ class LabDevice(AbstractLabDevice):
         # Serial device auto-discovery (currently for serial connection only)
         port = self.connection.connection_parameters.get("port")
         if isinstance(self.connection, SerialConnection) and (port == "" or port is None):
-            if sys.platform == "win32":
-                # Check which ports are physically present
-                self.logger.info("Serial port name not provided, trying autodiscovery.")
-                for i in range(1,255):
-                    port_name = f"COM{i}"
-                    try:
-                        self.connection.connection_parameters["port"] = port_name
-                        self.connection.open_connection()
-                        # Check if there is correct device on the port found
-                        self.logger.info("Found serial port %s, checking device...", port_name)
-                        # is_connected() usually checks an id string which devices reply rather fast
-                        # so makes sense to temporarily decrease timeout here to loop faster
-                        timeout = self.connection.receive_timeout
-                        self.connection.receive_timeout = 0.1
-                        if self.is_connected():
-                            self.logger.info("Device %s found on %s.", self.name, port_name)
-                            self.logger.info("Opened connection.")
-                            self.connection.receive_timeout = timeout
-                            return
-                        else:
-                            self.connection.receive_timeout = timeout
-                            self.connection.close_connection()
-                            self.logger.info("Device not found.")
-                    except PLConnectionError:
-                        pass
-                self.connection.connection_parameters["port"] = None
-                self.logger.info("No device found on any available serial port")
-                return
+            # Check which ports are physically present
+            self.logger.info("Serial port name not provided, trying autodiscovery.")
+            for port_name in discovery.scan():
+                try:
+                    self.connection.connection_parameters["port"] = port_name
+                    self.connection.open_connection()
+                    # Check if there is correct device on the port found
+                    self.logger.info("Found serial port %s, checking device...", port_name)
+                    # is_connected() usually checks an id string which devices reply rather fast
+                    # so makes sense to temporarily decrease timeout here to loop faster
+                    timeout = self.connection.receive_timeout
+                    self.connection.receive_timeout = 0.1
+                    if self.is_connected():
+                        self.logger.info("Device %s found on %s.", self.device_name, port_name)
+                        self.logger.info("Opened connection.")
+                        self.connection.receive_timeout = timeout
+                        return
+                    else:
+                        self.connection.receive_timeout = timeout
+                        self.connection.close_connection()
+                        self.logger.info("Device not found.")
+                except PLConnectionError:
+                    pass
+            self.connection.connection_parameters["port"] = None
+            self.logger.info("No device found on any available serial port")
+            return
         try:
             self.connection.open_connection()
         except (PLConnectionError, PLConnectionTimeoutError) as e:
@@ -261,52 +265,51 @@ class LabDevice(AbstractLabDevice):
 
         # Value type casting
         # TODO think about moving type to check dictionary
-        if "type" in cmd.keys() and cmd["type"] is not None:
+        value_type = cmd.get("type")
+        if value_type is not None:
             try:
-                value = cmd["type"](value)
-                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, cmd["type"])
+                value = value_type(value)
+                self.logger.debug("check_value()::type casted value <%s> to <%s>.", value, value_type)
             # Invalid type definition
             except TypeError:
-                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", cmd["type"], cmd["name"])
+                self.logger.error("check_value()::Illegal type <%s> specification in command <%s> definition.", value_type, cmd["name"])
             # Type cast error
             except ValueError:
-                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{cmd['type']}>.")
+                raise PLDeviceCommandError(f"Can't cast value <{value}> to type <{value_type}>.")
         else:
             self.logger.debug("check_value()::type casting not required - skipped.")
 
         # Check if any checking/processing is required acc. to cmd definition
-        check_needed = cmd.get("check", False)
-        if check_needed is False:
+        check = cmd.get("check")
+        if check is None or check is False:
             return value
 
         # Value checking
-        if "check" in cmd.keys() and cmd["check"] is not None:
-
-            # Min/max check
-            try:
-                if value < cmd["check"]["min"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{cmd['check']['min']}> !")
-                self.logger.debug("check_value()::min check <%s> < <%s>", value, cmd['check']['min'])
-                if value > cmd["check"]["max"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{cmd['check']['max']}> !")
-                self.logger.debug("check_value()::max check <%s> > <%s>", value, cmd['check']['max'])
-            # No cmd["check"]["min"] or cmd["check"]["max"]
-            except KeyError:
-                self.logger.debug("check_value()::min/max check not required - skipped.")
-            # Invalid value in cmd["check"]["min"] or cmd["check"]["max"]
-            except TypeError:
-                self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
+        # Min/max check
+        try:
+            if value < check["min"]:
+                raise PLDeviceCommandError(f"Requested value <{value}> is below limit <{check['min']}> !")
+            self.logger.debug("check_value()::min check <%s> < <%s>", value, check['min'])
+            if value > check["max"]:
+                raise PLDeviceCommandError(f"Requested value <{value}> is above limit <{check['max']}> !")
+            self.logger.debug("check_value()::max check <%s> > <%s>", value, check['max'])
+        # No check["min"] or check["max"]
+        except KeyError:
+            self.logger.debug("check_value()::min/max check not required - skipped.")
+        # Invalid value in check["min"] or check["max"]
+        except TypeError:
+            self.logger.error("Illegal min/max values specification in command <%s> definition!", cmd["name"])
 
-            # Value in range check
-            try:
-                if value not in cmd["check"]["values"]:
-                    raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{cmd['check']['values']}>.")
-                self.logger.debug("check_value()::range check <%s> in range <%s>", value, cmd["check"]["values"])
-            # No cmd["check"]["range"]
-            except KeyError:
-                self.logger.debug("check_value()::range check not required - skipped.")
-            except TypeError:
-                self.logger.error("Illegal range specification in command <%s> definition.", cmd["name"])
+        # Value in range check
+        try:
+            if value not in check["values"]:
+                raise PLDeviceCommandError(f"Requested value <{value}> not in the allowed range <{check['values']}>.")
+            self.logger.debug("check_value()::range check <%s> in range <%s>", value, check["values"])
+        # No check["values"]
+        except KeyError:
+            self.logger.debug("check_value()::range check not required - skipped.")
+        except TypeError:
+            self.logger.error("Illegal range specification in command <%s> definition.", cmd["name"])
         return value
 
     def prepare_message(self, cmd: Dict, value: Any) -> str:
@@ -436,9 +439,13 @@ class LabDevice(AbstractLabDevice):
                 casted_reply = False
             # Special case - returned value is a string representing float (e.g.
             # "0.0") and we need to cast it to int. int("0.0") would give a
-            # ValueError, so we need to convert it to float first
+            # ValueError, so we need to convert it to float first.
+            # Integer strings are the common case, so they are tried first.
             if cmd["reply"]["type"] is int:
-                casted_reply = int(float(reply))
+                try:
+                    casted_reply = int(reply)
+                except ValueError:
+                    casted_reply = int(float(reply))
             else:
                 casted_reply = cmd["reply"]["type"](reply)
             self.logger.debug("cast_reply_type()::casted reply type to %s.", cmd['reply']['type'])
@@ -480,8 +487,10 @@ class LabDevice(AbstractLabDevice):
         with self._lock:
             if check_ready is None:
                 check_ready = self.is_idle
+            interval = self.READY_POLLING_INTERVAL_MIN
             while not check_ready():
-                sleep(0.5)
+                sleep(interval)
+                interval = min(interval * 1.5, self.READY_POLLING_INTERVAL_MAX)
             #TODO Think how to reduce the amount of repeated log messages here.
             # Maybe invert execute_when_ready() <-> wait_until_ready() logic
             #self.logger.info("Waiting done. Device <%s> ready.", self.device_name)
@@ -1,6 +1,5 @@
 """PyLabware driver for Buchi R300 rotavap."""
 import json
-import urllib3
 from typing import Dict, Union, Optional, Any
 
 # Core imports
@@ -167,6 +166,7 @@ class R300Rotovap(AbstractRotavap, AbstractPressureController):
         self.reply_terminator = None
 
         # Disable requests warnings about Buchi self-signed certificate
+        import urllib3
         urllib3.disable_warnings()
 
     def prepare_message(self, cmd: Dict, value: Any) -> Any:
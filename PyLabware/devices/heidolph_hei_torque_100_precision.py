@@ -3,8 +3,6 @@
 import re
 
 from typing import Any, Optional, Dict, Union
-import serial
-
 
 # Core imports
 from .. import parsers as parser
@@ -78,6 +76,8 @@ class HeiTorque100PrecisionStirrer(AbstractStirringController):
         # Load commands from helper class
         self.cmd = HeiTorque100PrecisionStirrerCommands
 
+        import serial
+
         # connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -3,8 +3,6 @@
 import re
 
 from typing import Any, Optional, Union, Dict
-import serial
-
 
 # Core imports
 from .. import parsers as parser
@@ -68,6 +66,8 @@ class RZR2052ControlStirrer(AbstractStirringController):
         # Load commands from helper class
         self.cmd = RZR2052ControlStirrerCommands
 
+        import serial
+
         # Connection settings for serial connection
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
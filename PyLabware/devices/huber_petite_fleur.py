@@ -2,7 +2,6 @@
 
 from time import sleep
 from typing import Tuple, Optional, Union
-import serial
 
 # Core import
 import PyLabware.parsers as parser
@@ -85,6 +84,9 @@ class PetiteFleurChiller(AbstractTemperatureController):
         """
 
         self.cmd = PetiteFleurChillerCommands
+
+        import serial
+
         # serial settings
         # all settings are at default
         connection_parameters: ConnectionParameters = {}
@@ -2,7 +2,6 @@
 
 from typing import Optional, Union
 import time
-import serial
 
 # Core imports
 from ..controllers import AbstractDistributionValve, in_simulation_device_returns
@@ -87,6 +86,9 @@ class IDEXMXIIValve(AbstractDistributionValve):
 
         # Load commands from helper class
         self.cmd = IDEXMXIIValveCommands
+
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -1,7 +1,6 @@
 """PyLabware driver for IKA Microstar 75 overhead stirrer."""
 
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -78,6 +77,8 @@ class Microstar75Stirrer(AbstractStirringController):
         # Load commands from helper class
         self.cmd = Microstar75StirrerCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
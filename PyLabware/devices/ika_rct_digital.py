@@ -1,7 +1,6 @@
 """PyLabware driver for IKA RCT Digital stirring hotplate."""
 
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -74,6 +73,8 @@ class RCTDigitalHotplate(AbstractHotplate):
         # Load commands from helper class
         self.cmd = RCTDigitalHotplateCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -1,7 +1,6 @@
 """PyLabware driver for IKA RET Control Visc stirring hotplate."""
 
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -114,6 +113,8 @@ class RETControlViscHotplate(AbstractHotplate):
         # Load commands from helper class
         self.cmd = RETControlViscHotplateCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -1,7 +1,6 @@
 """PyLabware driver for IKA RV10 rotavap."""
 
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -104,6 +103,8 @@ class RV10Rotovap(AbstractRotavap):
         # Load commands from helper class
         self.cmd = RV10RotovapCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -4,8 +4,6 @@ import threading
 from time import sleep
 from typing import Optional, Union
 
-import serial
-
 # Core imports
 from .. import parsers as parser
 from ..controllers import AbstractTemperatureController, in_simulation_device_returns
@@ -244,6 +242,8 @@ class CF41Chiller(AbstractTemperatureController):
 
         self.cmd = CF41ChillerCommands
 
+        import serial
+
         # Serial connection settings - p.71 of the manual
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
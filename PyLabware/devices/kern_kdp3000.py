@@ -2,7 +2,6 @@
 
 import re
 from typing import Optional, Union, Dict, Any
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -35,6 +34,14 @@ class KDP3000BalanceCommands(LabDeviceCommands):
         "+": "Overweight!",
         "-": "Underweight!"
     }
+    # Exceptions raised for each of the error codes
+    ERROR_EXCEPTIONS = {
+        "L": PLDeviceError,
+        "I": PLDeviceError,
+        "ES": PLDeviceCommandError,
+        "+": PLDeviceError,
+        "-": PLDeviceError
+    }
 
     # ################### Control commands ###################################
     # Get list of commands
@@ -58,15 +65,25 @@ class KDP3000BalanceCommands(LabDeviceCommands):
     # Zero weight immediately
     SET_ZERO_IMMEDIATE = {"name": "ZI", "reply":{"type": str}}
     # Get stable weight
-    GET_WEIGHT = {"name": "S", "reply":{"type": float, "parser": str.split, "args":[" "]}}
+    GET_WEIGHT = {"name": "S", "reply":{"type": float, "parser": str.split, "args":[" ", 1]}}
     # Get weight immediately
-    GET_WEIGHT_IMMEDIATE = {"name": "SI", "reply":{"type": float, "parser": str.split, "args":[" "]}}
+    GET_WEIGHT_IMMEDIATE = {"name": "SI", "reply":{"type": float, "parser": str.split, "args":[" ", 1]}}
     # Record calibration zero point
     CALIBRATE_ZERO = {"name": "JZ", "reply":{"type": str}}
     # Record max weight calibration point
     CALIBRATE_MAX = {"name": "JG", "reply":{"type": str}}
     # Save calibration data
     CALIBRATION_SAVE = {"name": "JS", "reply":{"type": str}}
+    # External calibration procedure, see calibrate().
+    # Each step is (prompt for the user, progress message, command to send, failure message)
+    CALIBRATION_STEPS = (
+        ("Please insure that the balance are leveled on a hard surface and the weighting pan is empty. Press <Enter> when ready.",
+         "Running zero point calibration...", CALIBRATE_ZERO, "Zero calibration failed!"),
+        ("Please put the calibration weight (3kg, class F1) in the weighting pan and press <Enter>.",
+         "Running max point calibration...", CALIBRATE_MAX, "Maximum weight calibration failed!"),
+        ("Please remove the calibration weight from the weighting pan and press <Enter>.",
+         "Storing calibration data...", CALIBRATION_SAVE, "Storing calibration data failed!"),
+    )
     # ################### Configuration commands #############################
 
     # Reset device
@@ -86,6 +103,8 @@ class KDP3000Balance(AbstractBalance):
         # Load commands from helper class
         self.cmd = KDP3000BalanceCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -125,22 +144,20 @@ class KDP3000Balance(AbstractBalance):
 
         # Strip reply terminator and prefix
         reply = parser.stripper(reply.body, self.reply_prefix, self.reply_terminator)
-        # Split into parts
-        command, response_code, *reply = str.split(reply, " ")
+        # Split off command echo and response code, the rest is the actual reply
+        command, _, reply = reply.partition(" ")
+        response_code, _, reply = reply.partition(" ")
         # Analyze response code
-        if response_code in self.cmd.ERROR_CODES:
-            if response_code in ("L", "I", "+", "-"):
-                raise PLDeviceError(self.cmd.ERROR_CODES[response_code])
-            elif response_code == "ES":
-                raise PLDeviceCommandError(self.cmd.ERROR_CODES[response_code])
-        elif response_code in self.cmd.RESPONSE_CODES:
-            # All fine
-            # Glue reply back into string and strip empty spaces and quotes
-            reply = " ".join(reply).strip(" ").strip('"')
-            self.logger.debug("Invoking parse_reply() of the base class with argument <%s>", reply)
-            return super().parse_reply(cmd, reply)
-        else:
+        error = self.cmd.ERROR_EXCEPTIONS.get(response_code)
+        if error is not None:
+            raise error(self.cmd.ERROR_CODES[response_code])
+        if response_code not in self.cmd.RESPONSE_CODES:
             raise PLDeviceError(f"Unknown response code <{response_code}> received from the device!")
+        # All fine
+        # Strip empty spaces and quotes
+        reply = reply.strip(" ").strip('"')
+        self.logger.debug("Invoking parse_reply() of the base class with argument <%s>", reply)
+        return super().parse_reply(cmd, reply)
 
     # TODO Maybe put power on/off in start/stop ?
     def start(self):
@@ -184,32 +201,18 @@ class KDP3000Balance(AbstractBalance):
 
         if internal is True:
             self.logger.error("This balance doesn't support internal calibration!")
-            return
-
-        input("Please insure that the balance are leveled on a hard surface and the weighting pan is empty. Press <Enter> when ready.")
-        self.logger.info("Running zero point calibration...")
-        try:
-            self.send(self.cmd.CALIBRATE_ZERO)
-        except PLDeviceError as e:
-            self.logger.error("Zero calibration failed! %s", e.args[0])
-            return
-
-        input("Please put the calibration weight (3kg, class F1) in the weighting pan and press <Enter>.")
-        self.logger.info("Running max point calibration...")
-        try:
-            self.send(self.cmd.CALIBRATE_MAX)
-        except PLDeviceError as e:
-            self.logger.error("Maximum weight calibration failed! %s", e.args[0])
-            return
+            return False
 
-        input("Please remove the calibration weight from the weighting pan and press <Enter>.")
-        self.logger.info("Storing calibration data...")
-        try:
-            self.send(self.cmd.CALIBRATION_SAVE)
-        except PLDeviceError as e:
-            self.logger.error("Storing calibration data failed! %s", e.args[0])
-            return
+        for prompt, message, cmd, failure_message in self.cmd.CALIBRATION_STEPS:
+            input(prompt)
+            self.logger.info(message)
+            try:
+                self.send(cmd)
+            except PLDeviceError as e:
+                self.logger.error("%s %s", failure_message, e.args[0])
+                return False
         self.logger.info("Calibration done!")
+        return True
 
     def set_tare(self, stable=True) -> None:
         """Sets tare weight to the currently measured value.
@@ -1,12 +1,13 @@
 """PyLabware driver for Metrohm 781 pH/Ion meter."""
 
+import re
+from time import monotonic
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
 from ..controllers import LabDevice, in_simulation_device_returns
-from ..exceptions import PLConnectionError
+from ..exceptions import PLConnectionError, PLDeviceCommandError
 from ..models import LabDeviceCommands, ConnectionParameters
 
 
@@ -18,14 +19,19 @@ class Metrohm781pHMeterCommands(LabDeviceCommands):
     # Default firmware version example and regex
     DEFAULT_FW_VER = "5.781.0010"
     FW_VER_REGEX = r'\d\.\d{3}\.\d{4}'
+    FW_VER_RE = re.compile(FW_VER_REGEX)
+    # For how long in seconds a successful connection check is reused
+    CONNECTION_CHECK_TTL = 1.0
     # Global instrument statuses
     GLOBAL_STATUSES = {"$R": "Idle", "$G": "Running", "$S": "Stopped"}
     # States of the stirrer
     STIRRER_STATUSES = {"ON": True, "OFF": False}
+    # Stirring speeds and their quoted form sent to the device
+    SPEED_VALUES = {i: f'"{i}"' for i in range(1, 16)}
 
     # ################### Control commands ###################################
     # Get firmware version
-    GET_FW_VER = {"name": "&Config.Aux.Prog $Q", "reply": {"type": str, "parser":parser.researcher, "args":[FW_VER_REGEX]}}
+    GET_FW_VER = {"name": "&Config.Aux.Prog $Q", "reply": {"type": str, "parser":parser.researcher, "args":[FW_VER_RE]}}
     # Get status
     GET_STATUS = {"name": "$D", "reply": {"type": str}}
     # Get primary measured value (pH in pH mode)
@@ -41,7 +47,7 @@ class Metrohm781pHMeterCommands(LabDeviceCommands):
     # Get stirring speed setpoint
     GET_SPEED_SET = {"name": "&Mode.pH.MeasPara.Stirrer.Rate $Q", "reply": {"type": int, "parser":parser.stripper, "args":['"', '"']}}
     # Set stirring speed
-    SET_SPEED = {"name": "&Mode.pH.MeasPara.Stirrer.Rate", "type": str, "check":{"values": [f'"{i}"' for i in range(1,16)]}}
+    SET_SPEED = {"name": "&Mode.pH.MeasPara.Stirrer.Rate", "type": str, "check":{"values": frozenset(SPEED_VALUES.values())}}
 
 
 #FIXME add abstract class for the pH meter
@@ -58,6 +64,8 @@ class Metrohm781pHMeter(LabDevice):
         # Load commands from helper class
         self.cmd = Metrohm781pHMeterCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -73,6 +81,9 @@ class Metrohm781pHMeter(LabDevice):
         self.reply_terminator = "\r\r\n"
         self.args_delimiter = " "
 
+        # Time of the last successful connection check, None if not checked yet
+        self._connection_check_time: Optional[float] = None
+
     def initialize_device(self):
         """Set default operation mode & reset.
         """
@@ -80,22 +91,33 @@ class Metrohm781pHMeter(LabDevice):
     @in_simulation_device_returns(Metrohm781pHMeterCommands.DEFAULT_FW_VER)
     def is_connected(self) -> bool:
         """ Check if the device is connected via GET_FW_VER command.
+        A successful check is reused for CONNECTION_CHECK_TTL seconds
+        while the connection remains open.
         """
 
+        if self._connection_check_time is not None and self.connection.is_connection_open():
+            if monotonic() - self._connection_check_time < self.cmd.CONNECTION_CHECK_TTL:
+                return True
+        self._connection_check_time = None
         try:
             reply = self.send(self.cmd.GET_FW_VER)
         except PLConnectionError:
             return False
-        return reply is not None
+        if reply is None:
+            return False
+        self._connection_check_time = monotonic()
+        return True
 
     @in_simulation_device_returns("$R.Mode.pH.DriftOk")
     def is_idle(self) -> bool:
         """Returns True if no measurement is active.
         """
 
-        if not self.is_connected():
+        # A status reply proves the connection as well, no separate check needed
+        try:
+            return self.get_status() == self.cmd.GLOBAL_STATUSES["$R"]
+        except PLConnectionError:
             return False
-        return self.get_status() == self.cmd.GLOBAL_STATUSES["$R"]
 
     def get_status(self):
         """ Gets global device status.
@@ -149,7 +171,11 @@ class Metrohm781pHMeter(LabDevice):
         """Sets desired speed.
         """
 
-        self.send(self.cmd.SET_SPEED, f"\"{speed}\"")
+        # Speed is sent quoted, the allowed values are prepared in advance
+        payload = self.cmd.SPEED_VALUES.get(speed)
+        if payload is None:
+            raise PLDeviceCommandError(f"Requested speed <{speed}> not in the allowed range <1-15>.")
+        self.send(self.cmd.SET_SPEED, payload)
 
     def get_ph(self) -> float:
         """Gets current viscosity rend.
@@ -1,7 +1,7 @@
 """PyLabware driver for Mettler Toledo MS3002S balance."""
 
+from time import monotonic
 from typing import Optional, Union
-import serial
 
 # Core imports
 from .. import parsers as parser
@@ -19,6 +19,8 @@ class MS3002SBalanceCommands(LabDeviceCommands):
     DEFAULT_TYPE = "MS3002S/01"
     # Maximum allowed weight, in grams
     MAX_WEIGHT = 3200
+    # For how long in seconds a successful connection check is reused
+    CONNECTION_CHECK_TTL = 1.0
 
     # ################### Control commands ###################################
     # Get list of commands
@@ -77,6 +79,8 @@ class MS3002SBalance(LabDevice):
         # Load commands from helper class
         self.cmd = MS3002SBalanceCommands
 
+        import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -92,6 +96,9 @@ class MS3002SBalance(LabDevice):
         self.reply_terminator = "\r\n"
         self.args_delimiter = " "
 
+        # Time of the last successful connection check, None if not checked yet
+        self._connection_check_time: Optional[float] = None
+
     def initialize_device(self):
         """Issue reset command.
         """
@@ -102,14 +109,23 @@ class MS3002SBalance(LabDevice):
     @in_simulation_device_returns([MS3002SBalanceCommands.DEFAULT_TYPE])
     def is_connected(self) -> bool:
         """ Check if the device is connected via GET_NAME command.
+        A successful check is reused for CONNECTION_CHECK_TTL seconds
+        while the connection remains open.
         """
 
+        if self._connection_check_time is not None and self.connection.is_connection_open():
+            if monotonic() - self._connection_check_time < self.cmd.CONNECTION_CHECK_TTL:
+                return True
+        self._connection_check_time = None
         try:
             reply = self.send(self.cmd.GET_NAME)
         except PLConnectionError:
             return False
         reply = reply[-1]
-        return self.cmd.DEFAULT_TYPE in reply
+        if self.cmd.DEFAULT_TYPE not in reply:
+            return False
+        self._connection_check_time = monotonic()
+        return True
 
     # TODO Maybe put power on/off in start/stop ?
     def start(self):
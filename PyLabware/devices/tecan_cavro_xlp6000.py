@@ -1,8 +1,9 @@
 """PyLabware driver for the TECAN Cavro XLP 6000 syringe pump with integrated valve."""
 
-from typing import Optional, Union, Dict, Any
-from time import sleep
-import serial
+import threading
+from contextlib import contextmanager
+from time import monotonic
+from typing import Optional, Union, Dict, Any, Tuple, Callable, List
 
 # Core import
 from .. import parsers as parser
@@ -46,7 +47,7 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
     # Y-valves, 90°-valves and T-valves use IOBE-notation
     # 6-pos valves use I1..I6/O1..O6 notation (I - moves CW, O - moves CCW)
     # 3-pos distribution valves can use either IOBE or I1..I3/O1..O3 depending how they were configured (Uxx command)
-    VALVE_POSITIONS = (
+    VALVE_POSITIONS = frozenset((
         "",  # This is to pass check when IOBE addressing is used and I or O is requested
         "1",
         "2",
@@ -57,7 +58,7 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
         "7",
         "8",
         "9"
-    )
+    ))
 
     # Valve types for Uxx command
     VALVE_TYPES = {
@@ -70,6 +71,9 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
         "6PORT_DISTR": "7",  # I1..In, O1..On control
         "9PORT_DISTR": "8" # I1..In, O1..On control
     }
+    # Valve type codes checked by the valve position commands, looked up once here
+    VALVE_CODE_6PORT_DISTR = VALVE_TYPES["6PORT_DISTR"]
+    VALVE_CODES_IN_ON = frozenset((VALVE_TYPES["3PORT_DISTR_IO"], VALVE_TYPES["6PORT_DISTR"]))
 
     # Plunger motor resolution modes
     RESOLUTION_MODES = {
@@ -164,10 +168,18 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
         0b1110: "ADC failure!",
         0b1111: "Command overflow!"
     }
+    # Same error messages indexed by error code, None for codes not in the manual
+    ERROR_MESSAGES = tuple(map(ERROR_CODES.get, range(16)))
 
     # Default status - pump initialized, idle, no error
     DEFAULT_STATUS = "`"
 
+    # For how long in seconds the status from the last status query is considered valid
+    STATUS_VALIDITY_PERIOD = 0.05
+
+    # Plunger increments in a full syringe stroke (N0/N1 resolution modes)
+    FULL_STROKE = 6000
+
     # ################### Control commands ###################################
 
     # ## Initialization commands ##
@@ -205,6 +217,13 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
     VALVE_MOVE_B = {"name": "B", "reply": {"type": str}}
     # Rotate valve to extra position. No check as there are no arguments.
     VALVE_MOVE_E = {"name": "E", "reply": {"type": str}}
+    # Valve commands by the first letter of the valve position requested
+    VALVE_MOVE_COMMANDS = {
+        "I": VALVE_MOVE_I,
+        "O": VALVE_MOVE_O,
+        "B": VALVE_MOVE_B,
+        "E": VALVE_MOVE_E
+    }
 
     # ## Execution flow control commands ##
     # Execute command string
@@ -217,14 +236,16 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
     PRG_EEPROM_EXEC = {"name": "e", "reply": {"type": str}}
     # Mark start of looped command sequence
     PRG_MARK_LOOP_START = {"name": "g"}
-    # Mark end of looped command sequence
-    PRG_MARK_LOOP_END = {"name": "G"}
+    # Mark end of looped command sequence, argument - number of repeats. 0 would loop forever, so not allowed.
+    PRG_MARK_LOOP_END = {"name": "G", "type": int, "check": {"min": 1, "max": 30000}}
     # Delay command execution
     PRG_DELAY_EXEC = {"name": "M"}
     # Halt command execution (wait for R command and/or ext. input change)
     PRG_HALT = {"name": "H", "reply": {"type": str}}
     # Terminate commands execution
     PRG_TERM = {"name": "T", "reply": {"type": str}}
+    # Arbitrary command string, used to send several commands in one go
+    PRG_CMD_STRING = {"name": "", "reply": {"type": str}}
 
     # ## Report commands ##
     # Query pump status
@@ -260,7 +281,7 @@ class XLP6000SyringePumpCommands(LabDeviceCommands):
     # Set dead volume
     SET_DEAD_VOL = {"name": "k", "reply": {"type": str}}
     # Set acceleration/deceleration ramp slope
-    SET_RAMP_SLOPE = {"name": "L", "type": str, "check": {"values": RAMP_SLOPE_MODES.keys()}}
+    SET_RAMP_SLOPE = {"name": "L", "type": str, "check": {"values": RAMP_SLOPE_MODES.keys()}, "reply": {"type": str}}
     # Set start velocity (beginning of ramp)
     SET_START_VEL = {"name": "v", "type": int, "check": {"min": 1, "max": 8000}, "reply": {"type": str}}
     # Set maximum velocity (top of ramp) in increments/second
@@ -284,6 +305,8 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
     # As there can be multiple pumps on the same serial port, it's necessary to maintain a list
     # Example: {"COM3":{"pumps":1, "conn":<PyLabware.connections.SerialConnection at 0x1111>}}
     BUS_DEVICES = {}
+    # Lock protecting BUS_DEVICES, as pumps can be created and disconnected from different threads
+    BUS_DEVICES_LOCK = threading.Lock()
 
     def __init__(self, device_name: str, connection_mode: str, address: Optional[str], port: Union[str, int],
                  switch_address: Union[int, str], syringe_size: Optional[float] = None, valve_type: str = "3PORT_DISTR_IO"):
@@ -302,10 +325,11 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         self._steps_per_ml = None
 
         # Check that valid valve type has been passed
-        try:
-            self._valve_type = XLP6000SyringePumpCommands.VALVE_TYPES[valve_type]
-        except KeyError:
-            raise PLDeviceError("Invalid valve type <{}> provided!".format(valve_type)) from None
+        self._valve_type = XLP6000SyringePumpCommands.VALVE_TYPES.get(valve_type)
+        if self._valve_type is None:
+            raise PLDeviceError("Invalid valve type <{}> provided!".format(valve_type))
+
+        import serial
 
         # Connection settings
         connection_parameters: ConnectionParameters = {}
@@ -322,30 +346,47 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         super().__init__(device_name, connection_mode, connection_parameters)
 
         # Check if we already have the required COM port open
-        try:
-            self.connection = type(self).BUS_DEVICES[port]["conn"]
+        with type(self).BUS_DEVICES_LOCK:
+            bus_entry = type(self).BUS_DEVICES.setdefault(port, {"pumps": 0, "conn": self.connection})
             # Increase reference count
-            self.logger.debug("Existing connection for port <%s> found, reusing <%s>", port, self.connection)
-            type(self).BUS_DEVICES[port]["pumps"] += 1
-        except KeyError:
-            type(self).BUS_DEVICES[port] = {"pumps": 1, "conn": self.connection}
-            self.logger.debug("Storing new serial connection reference <%s> for port <%s>", self.connection, port)
+            bus_entry["pumps"] += 1
+            if bus_entry["pumps"] == 1:
+                self.logger.debug("Storing new serial connection reference <%s> for port <%s>", self.connection, port)
+            else:
+                self.connection = bus_entry["conn"]
+                self.logger.debug("Existing connection for port <%s> found, reusing <%s>", port, self.connection)
 
         # Set switch address
-        try:
-            switch_address = self.cmd.SWITCH_ADDRESSES[str(switch_address)]
-        except KeyError:
-            raise PLDeviceError("Invalid switch address <{}> supplied!".format(switch_address)) from None
+        # Switch positions above 9 are marked with hex digits A..E on the pump
+        if isinstance(switch_address, int):
+            switch_position = format(switch_address, "X")
+        else:
+            switch_position = str(switch_address)
+        address_code = self.cmd.SWITCH_ADDRESSES.get(switch_position)
+        if address_code is None:
+            raise PLDeviceError("Invalid switch address <{}> supplied!".format(switch_address))
 
         # Protocol settings
-        self.command_prefix = "/" + switch_address
+        self.command_prefix = "/" + address_code
+        # Command terminators with and without the run command,
+        # prepared once to be swapped by the autorun property
+        self._terminator_run = self.cmd.PRG_RUN["name"] + "\r\n"
+        self._terminator_no_run = "\r\n"
         # Run commands after sending them to pump by default (R appended)
-        self.command_terminator = self.cmd.PRG_RUN["name"] + "\r\n"
+        self.command_terminator = self._terminator_run
         self.reply_prefix = "/0"
         self.reply_terminator = "\x03\r\n"
         self.args_delimiter = ""
         # Pump status byte
         self._last_status = 0
+        # Time of the last status query reply, None if any other command has been sent since
+        self._last_status_time: Optional[float] = None
+        # Status change subscribers - (callback, status bit mask) pairs
+        self._status_subscribers: List[Tuple[Callable[[int], None], int]] = []
+        # Firmware version read out by is_connected(), None if not read yet
+        self._fw_version: Optional[str] = None
+        # Pump configuration read out by get_pump_configuration(), None if not read yet
+        self._pump_configuration: Optional[str] = None
 
     @property
     def autorun(self):
@@ -353,7 +394,7 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         or queued instead.
         """
 
-        return self.cmd.PRG_RUN["name"] in self.command_terminator
+        return self.command_terminator == self._terminator_run
 
     @autorun.setter
     def autorun(self, value):
@@ -361,9 +402,25 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """
 
         if value is True:
-            self.command_terminator = self.cmd.PRG_RUN["name"] + "\r\n"
+            self.command_terminator = self._terminator_run
         else:
-            self.command_terminator = "\r\n"
+            self.command_terminator = self._terminator_no_run
+
+    @contextmanager
+    def _no_autorun(self):
+        """Context manager disabling autorun for the commands sent within,
+        and restoring the original autorun state afterwards.
+        """
+
+        # Hold the device lock so that other threads don't send anything
+        # with the terminator swapped
+        with self._lock:
+            command_terminator = self.command_terminator
+            self.command_terminator = self._terminator_no_run
+            try:
+                yield
+            finally:
+                self.command_terminator = command_terminator
 
     @property
     def syringe_size(self):
@@ -379,7 +436,7 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
             self.logger.warning("Changing syringe size resetted volumetric calibration.")
         self._syringe_size = value
         self._volumetric_calibrated = False
-        self.steps_per_ml = 6000 / value
+        self.steps_per_ml = self.cmd.FULL_STROKE / value
 
     @property
     def steps_per_ml(self):
@@ -406,20 +463,24 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
             If not - decreases the reference count.
         """
 
+        self.invalidate_cache()
         # TODO check if we are closing the connection for ourselves!
         if not self.connection.is_connection_open():
             self.logger.warning("Connection not open yet!")
             return
         # Check current reference count for the serial port open
         #FIXME probably wouldn't work for other than serial connection
-        current_refs = type(self).BUS_DEVICES[self.port]["pumps"]
-        current_refs -= 1
-        if current_refs == 0:
-            _ = type(self).BUS_DEVICES.pop(self.port)
-            super().disconnect()
-        else:
-            type(self).BUS_DEVICES[self.port]["pumps"] = current_refs
-            self.logger.info("%s more devices left on the bus, leaving connection open.", current_refs)
+        # The connection is closed under the lock as well, so that a pump
+        # created meanwhile doesn't pick up the connection being closed
+        with type(self).BUS_DEVICES_LOCK:
+            bus_devices = type(self).BUS_DEVICES
+            bus_entry = bus_devices[self.port]
+            bus_entry["pumps"] -= 1
+            if bus_entry["pumps"] == 0:
+                del bus_devices[self.port]
+                super().disconnect()
+            else:
+                self.logger.info("%s more devices left on the bus, leaving connection open.", bus_entry["pumps"])
 
     def parse_reply(self, cmd: Dict, reply: Any) -> str:
         """Overloaded method from base class. We need to do some more
@@ -430,8 +491,16 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         reply = parser.stripper(reply.body, self.reply_prefix, self.reply_terminator)
         # Then analyze status byte
         # Status byte is the 1st byte of reply string, & we need it's byte code.
-        self._last_status = ord(reply[0])
+        status = ord(reply[0])
+        changed_bits = status ^ self._last_status
+        self._last_status = status
+        # Only the status query reply is reused by _check_status_bit(),
+        # any other command might have changed the pump state
+        self._last_status_time = monotonic() if cmd is self.cmd.GET_STATUS else None
         self.check_errors()
+        # Subscribers are only notified of the replies that passed the error check
+        if changed_bits:
+            self._notify_status_subscribers(changed_bits)
         self.logger.debug("parse_reply()::status byte checked, invoking parsing on <%s>", reply[1:])
         # Chop off status byte & do standard processing
         return super().parse_reply(cmd, reply[1:])
@@ -447,25 +516,37 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         # No error
         if error_code == 0:
             return None
-        try:
-            raise PLDeviceInternalError(self.cmd.ERROR_CODES[error_code])
-        except KeyError:
+        error_message = self.cmd.ERROR_MESSAGES[error_code]
+        if error_message is None:
             # This shouldn't really happen, means that pump replied with
             # error code not in the ERROR_CODES dictionary
             # (which completely copies the manual)
-            raise PLDeviceReplyError("Unknown error! Status byte: {}".format(bin(self._last_status))) from None
+            raise PLDeviceReplyError("Unknown error! Status byte: {}".format(bin(self._last_status)))
+        raise PLDeviceInternalError(error_message)
+
+    def invalidate_cache(self):
+        """Drops the values read from the pump once and cached - firmware
+        version and pump configuration, so that they are read again on next request.
+        """
+
+        self._fw_version = None
+        self._pump_configuration = None
 
     def is_connected(self) -> bool:
         """Checks whether the device is connected by
-        checking it's firmware version.
+        checking it's firmware version. The version is read only once
+        while the connection remains open.
         """
 
+        if self._fw_version is not None and self.connection.is_connection_open():
+            return True
         try:
             version = self.send(self.cmd.GET_FW_VER)
             self.logger.debug("is_connected()::Device connected; FW version <%s>", version)
-            return True
         except PLConnectionError:
             return False
+        self._fw_version = version
+        return True
 
     def get_status(self):
         """Not supported on this device.
@@ -502,6 +583,8 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         # last(I) and first(O) for CCW init
         for port in [input_port, output_port]:
             if port is not None:
+                # Port numbers can be passed as int as well
+                port = str(port)
                 if port not in self.cmd.VALVE_POSITIONS:
                     raise PLDeviceCommandError("Invalid port for initialization was provided!")
                 arglist.append(port)
@@ -515,37 +598,89 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
 
         self.logger.info("Device initialized.")
 
+    def _check_status_bit(self, bit: int) -> bool:
+        """Queries the pump status and checks a bit of the status byte.
+        If the pump status has just been queried, it is reused.
+
+        Args:
+            bit: Bit number, 0 - right-most bit.
+
+        Returns:
+            (bool): True if the bit is set, False if it's not set or the pump doesn't respond.
+        """
+
+        if self._last_status_time is None or monotonic() - self._last_status_time > self.cmd.STATUS_VALIDITY_PERIOD:
+            try:
+                _ = self.send(self.cmd.GET_STATUS)
+            except PLConnectionError:
+                return False
+        return self._last_status & 1 << bit != 0
+
     @in_simulation_device_returns(True)
     def is_initialized(self) -> bool:
         """Check if pump has been initialized properly after power-up.
         """
 
-        try:
-            _ = self.send(self.cmd.GET_STATUS)
-        except PLConnectionError:
-            return False
-        # Busy/idle bit is 7th bit of the status byte. 0 - busy, 1 - idle
-        if self._last_status & 1 << 6 == 0:
-            self.logger.debug("is_idle()::false.")
-            return False
-        self.logger.debug("is_idle()::true.")
-        return True
+        # Initialized bit is 7th bit of the status byte
+        initialized = self._check_status_bit(6)
+        self.logger.debug("is_initialized()::%s.", str(initialized).lower())
+        return initialized
 
     @in_simulation_device_returns(LabDeviceReply(body=XLP6000SyringePumpCommands.DEFAULT_STATUS))
     def is_idle(self) -> bool:
         """Checks if pump is in idle state.
         """
 
-        try:
-            _ = self.send(self.cmd.GET_STATUS)
-        except PLConnectionError:
-            return False
         # Busy/idle bit is 6th bit of the status byte. 0 - busy, 1 - idle
-        if self._last_status & 1 << 5 == 0:
-            self.logger.debug("is_idle()::false.")
-            return False
-        self.logger.debug("is_idle()::true.")
-        return True
+        idle = self._check_status_bit(5)
+        self.logger.debug("is_idle()::%s.", str(idle).lower())
+        return idle
+
+    def subscribe_status(self, callback: Callable[[int], None], mask: int = 0xFF):
+        """Registers a function to be called with the new status byte whenever
+        any of the status bits selected by mask changes.
+
+        The status byte is updated from every pump reply, including the ones
+        to the readiness polling done by execute_when_ready(), so no extra
+        serial traffic is generated. If nothing else talks to the pump, a
+        background task can be used to poll it, e.g. start_task(1, self.is_idle).
+
+        Subscribers are only notified of the replies passing check_errors().
+        A pump error appearing is reported by the exception raised from the
+        command, not by a callback. Its clearing is then seen as a change of
+        the error bits in the next good reply.
+
+        Args:
+            callback: Function taking the new status byte. It is called from
+                      the thread that got the pump reply, so should return quickly.
+                      Exceptions raised by it are logged and otherwise ignored.
+            mask: Status bits to watch, all by default.
+        """
+
+        with self._lock:
+            self._status_subscribers.append((callback, mask))
+
+    def unsubscribe_status(self, callback: Callable[[int], None]):
+        """Removes all subscriptions of the function provided.
+        """
+
+        with self._lock:
+            self._status_subscribers = [(cb, mask) for cb, mask in self._status_subscribers if cb != callback]
+
+    def _notify_status_subscribers(self, changed_bits: int):
+        """Calls the status subscribers watching any of the bits changed.
+        Callback errors are logged, so that they don't break the command being processed.
+        """
+
+        # Iterate over a copy, so that a callback can unsubscribe itself
+        with self._lock:
+            subscribers = list(self._status_subscribers)
+        for callback, mask in subscribers:
+            if changed_bits & mask:
+                try:
+                    callback(self._last_status)
+                except Exception as e:
+                    self.logger.error("Status subscriber <%s> failed: %s", callback, e)
 
     def start(self):
         """Starts program execution."""
@@ -597,13 +732,8 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
 
         # Send command & check reply for errors
         # If autorun is not disabled for the ? command, pump reports an operand error
-        autorun_state = self.autorun
-        self.autorun = False
-        try:
-            position = self.send(self.cmd.GET_SYR_POS)
-        finally:
-            self.autorun = autorun_state
-        return position
+        with self._no_autorun():
+            return self.send(self.cmd.GET_SYR_POS)
 
     def move_plunger_relative(self, position: int, set_busy: bool = True):
         """Makes relative plunger move. This is a wrapper for
@@ -619,7 +749,7 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """Makes relative dispense.
         """
 
-        increments = volume_ml * self.steps_per_ml
+        increments = round(volume_ml * self.steps_per_ml)
         if set_busy is True:
             cmd = self.cmd.SYR_SPIT_REL
         else:
@@ -632,7 +762,7 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """Makes relative aspiration.
         """
 
-        increments = volume_ml * self.steps_per_ml
+        increments = round(volume_ml * self.steps_per_ml)
         if set_busy is True:
             cmd = self.cmd.SYR_SUCK_REL
         else:
@@ -640,19 +770,39 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         # Send command & check reply for errors
         self.execute_when_ready(self.send, cmd, increments)
 
+    def _build_batched_command(self, *steps: Tuple[Dict, Any]) -> str:
+        """Builds a single command string out of several commands, so that
+        they can be sent to the pump in one go. The pump executes them one
+        after another. The run command is appended by command terminator as usual.
+
+        Args:
+            steps: (command, value) tuples, value is None if the command takes no arguments.
+
+        Returns:
+            (str): Command string.
+        """
+
+        command_string = ""
+        for cmd, value in steps:
+            command_string += cmd["name"]
+            if value is not None:
+                command_string += str(self.check_value(cmd, value))
+        return command_string
+
     def prime_pump(self, port: str, cycles: int = 2, increments: int = 2000) -> None:
         """ Primes the tubing and syringe to displace air
         """
 
         self.execute_when_ready(self.set_valve_position, port)
         self.execute_when_ready(self.move_plunger_absolute, 0)
+        # 2000 - 1/3 full stroke
+        # Delay is to allow the liquid to settle down. Adequate speed should be used.
+        priming_cycle = self._build_batched_command((self.cmd.SYR_MOVE_ABS, increments),
+                                                    (self.cmd.PRG_DELAY_EXEC, 3000),
+                                                    (self.cmd.SYR_MOVE_ABS, 0))
         for c in range(cycles):
             self.logger.info("Priming the pump <%s>, port %s, cycle %s out of %s...", self.device_name, port, c+1, cycles)
-            # 2000 - 1/3 full stroke
-            self.execute_when_ready(self.move_plunger_absolute, increments)
-            # Allow the liquid to settle down. Adequate speed should be used.
-            sleep(3)
-            self.execute_when_ready(self.move_plunger_absolute, 0)
+            self.execute_when_ready(self.send, self.cmd.PRG_CMD_STRING, priming_cycle)
             self.wait_until_ready()
             self.logger.info("Priming cycle %s done", c+1)
         self.wait_until_ready()
@@ -662,33 +812,39 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """ Transfers the required amount in mL from <port_from> to <port_to>.
         """
 
-        increments = volume_ml * self.steps_per_ml
-        complete_strokes = round(increments // 6000)
-        remainder = increments % 6000
+        increments = round(volume_ml * self.steps_per_ml)
+        complete_strokes, remainder = divmod(increments, self.cmd.FULL_STROKE)
         self.logger.info("Executing transfer of <%s> mL from <%s> to <%s>", volume_ml, port_from, port_to)
         self.logger.debug("Calculated <%s> full strokes plus <%s> mL", complete_strokes, remainder/self.steps_per_ml)
 
-        # Do full strokes
-        for i in range(complete_strokes):
-            self.logger.info("Doing full transfer cycle <%s> of <%s>", i+1, complete_strokes)
-            self.execute_when_ready(self.set_valve_position, port_from)
-            sleep(1)
-            self.execute_when_ready(self.move_plunger_absolute, 6000)
-            sleep(3)
-            self.execute_when_ready(self.set_valve_position, port_to)
-            sleep(1)
-            self.execute_when_ready(self.move_plunger_absolute, 0)
+        # The whole transfer is sent as a single command string:
+        # valve to port_from, withdraw, valve to port_to, dispense - for each stroke.
+        # The pump executes the commands one by one as each move completes,
+        # so no delays are needed in between
+        valve_from = self._get_valve_command(port_from)
+        valve_to = self._get_valve_command(port_to)
+        steps = []
+
+        # Do full strokes, repeated by the pump itself in a loop
+        if complete_strokes > 0:
+            self.logger.info("Doing <%s> full transfer cycles", complete_strokes)
+            steps += [(self.cmd.PRG_MARK_LOOP_START, None),
+                      valve_from,
+                      (self.cmd.SYR_MOVE_ABS, self.cmd.FULL_STROKE),
+                      valve_to,
+                      (self.cmd.SYR_MOVE_ABS, 0),
+                      (self.cmd.PRG_MARK_LOOP_END, complete_strokes)]
 
         # Do the remainder
         if remainder != 0:
             self.logger.info("Transferring remaining <%s> mL", remainder/self.steps_per_ml)
-            self.execute_when_ready(self.set_valve_position, port_from)
-            sleep(1)
-            self.execute_when_ready(self.move_plunger_absolute, remainder)
-            sleep(3)
-            self.execute_when_ready(self.set_valve_position, port_to)
-            sleep(1)
-            self.execute_when_ready(self.move_plunger_absolute, 0)
+            steps += [valve_from,
+                      (self.cmd.SYR_MOVE_ABS, remainder),
+                      valve_to,
+                      (self.cmd.SYR_MOVE_ABS, 0)]
+
+        if steps:
+            self.execute_when_ready(self.send, self.cmd.PRG_CMD_STRING, self._build_batched_command(*steps))
 
         # Wait for the final dispense to finish
         self.wait_until_ready()
@@ -704,19 +860,23 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         volume_measured = None
         calibration_steps = 2000
 
+        # Only port numbers are accepted,
+        # the empty position used for IOBE addressing is not a valid answer here
+        valve_ports = self.cmd.VALVE_POSITIONS - {""}
+
         print("Starting interactive volume calibration. Please check that the syringe is empty.")
-        while port_from not in self.cmd.VALVE_POSITIONS:
-            port_from = input("Please enter the port to withdraw the liquid from (1-9): ")
-        while port_to not in self.cmd.VALVE_POSITIONS:
-            port_to = input("Please enter the port to dispense the liquid to (1-9): ")
-        port_to = "I" + port_to
+        while port_from not in valve_ports:
+            port_from = input("Please enter the port to withdraw the liquid from (1-9): ").strip()
+        while port_to not in valve_ports:
+            port_to = input("Please enter the port to dispense the liquid to (1-9): ").strip()
         port_from = "I" + port_from
+        port_to = "I" + port_to
         print("Priming...")
         self.execute_when_ready(self.prime_pump, port_from)
         print("Priming done.")
         print("Withdrawing...")
         self.execute_when_ready(self.move_plunger_absolute, calibration_steps)
-        sleep(3)
+        # The valve is only switched once the busy bit shows the withdrawal is done
         self.execute_when_ready(self.set_valve_position, port_to)
         print("Dispensing...")
         self.execute_when_ready(self.move_plunger_absolute, 0)
@@ -729,12 +889,18 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         self.steps_per_ml = int(calibration_steps / volume_measured)
         # If syringe volume was not set manually - back calculate it from the calibration factor
         if self._syringe_size is None:
-            self.syringe_size = 6000 / self.steps_per_ml
+            self.syringe_size = self.cmd.FULL_STROKE / self.steps_per_ml
         print(f"Calibration done. Calibration factor (steps_per_ml): {self.steps_per_ml}. Calculated syringe volume: {self.syringe_size:.2f} mL.")
         self._volumetric_calibrated = True
 
-    def set_valve_position(self, requested_position: str):
-        """Sets the distribution valve position.
+    def _get_valve_command(self, requested_position: str) -> Tuple[Dict, str]:
+        """Matches the valve position requested against the valve commands.
+
+        Args:
+            requested_position: Valve position, e.g. "I", "O3" or "B".
+
+        Returns:
+            (tuple): Valve command and its argument.
         """
 
         requested_position = str(requested_position)
@@ -742,28 +908,28 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         # & check it against current valve type
         if len(requested_position) == 1:
             # IOBE addressing allowed for all but 6-way distribution valves
-            if self._valve_type == self.cmd.VALVE_TYPES["6PORT_DISTR"]:
+            if self._valve_type == self.cmd.VALVE_CODE_6PORT_DISTR:
                 self.logger.warning("Requested valve position doesn't seem to match valve type installed.")
         elif len(requested_position) == 2:
             # In/On addressing is allowed only for 6-way valves and 3-way valves.
-            if self._valve_type not in [self.cmd.VALVE_TYPES["3PORT_DISTR_IO"], self.cmd.VALVE_TYPES["6PORT_DISTR"]]:
+            if self._valve_type not in self.cmd.VALVE_CODES_IN_ON:
                 self.logger.warning("Requested valve position doesn't seem to match valve type installed.")
 
         # The position requested is the actual command we have to send to the pump.
         # But we need to match it against a defined command.
-        if requested_position[:1] == "I":
-            cmd = self.cmd.VALVE_MOVE_I
-        elif requested_position[:1] == "O":
-            cmd = self.cmd.VALVE_MOVE_O
-        elif requested_position == "B":
-            cmd = self.cmd.VALVE_MOVE_B
-        elif requested_position == "E":
-            cmd = self.cmd.VALVE_MOVE_E
-        else:
+        cmd = self.cmd.VALVE_MOVE_COMMANDS.get(requested_position[:1])
+        # B and E commands take no port number
+        if cmd is None or (requested_position[:1] in ("B", "E") and len(requested_position) != 1):
             raise PLDeviceCommandError(f"Unknown valve position <{requested_position}> requested!")
 
         # Get numeric position (if I1..I6/O1..O6 notation is used)
-        args = requested_position[1:]
+        return cmd, requested_position[1:]
+
+    def set_valve_position(self, requested_position: str):
+        """Sets the distribution valve position.
+        """
+
+        cmd, args = self._get_valve_command(requested_position)
 
         # Send command & check reply for errors
         self.execute_when_ready(self.send, cmd, args)
@@ -808,22 +974,29 @@ class XLP6000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """Sets valve type. This command requires power-cycle to activate new settings!
         """
 
+        # Get correct valve code. Checked before asking for confirmation,
+        # so that an invalid valve type is reported straight away
+        valve_code = XLP6000SyringePumpCommands.VALVE_TYPES.get(valve_type)
+        if valve_code is None:
+            raise PLDeviceCommandError("Invalid valve type requested!")
         self.logger.warning("Changing the valve type would require power-cycling the pump!")
         if confirm is not True:
-            self.logger.info("Please, execute set_valve_type(valve_type, confirm=True)"
+            self.logger.info("Please, execute set_valve_type(valve_type, confirm=True) "
                              "to write new valve configuration to pump EEPROM.")
             return
-        try:
-            # Get correct valve code
-            self._valve_type = XLP6000SyringePumpCommands.VALVE_TYPES[valve_type]
-        except KeyError:
-            raise PLDeviceCommandError("Invalid valve type requested!")
         # Send command & check reply for errors
-        self.send(self.cmd.SET_EEPROM, self._valve_type)
+        self.send(self.cmd.SET_EEPROM, valve_code)
+        # Only update the valve type once the pump has accepted it
+        self._valve_type = valve_code
+        self._pump_configuration = None
         self.logger.info("Valve type updated successfully. Don't forget to power-cycle the pump!")
 
     def get_pump_configuration(self):
-        """Reads pump EEPROM configuration.
+        """Reads pump EEPROM configuration. The configuration only changes
+        with set_valve_type(), so it is read from the pump once and cached.
         """
-        # Send command & check reply for errors
-        return self.send(self.cmd.GET_EEPROM_DATA)
+
+        if self._pump_configuration is None:
+            # Send command & check reply for errors
+            self._pump_configuration = self.send(self.cmd.GET_EEPROM_DATA)
+        return self._pump_configuration
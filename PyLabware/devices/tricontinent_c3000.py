@@ -1,7 +1,7 @@
 """PyLabware driver for Tricontinent С3000 syringe pump with integrated valve."""
 
+from time import monotonic
 from typing import Optional, Union, Dict, Any
-import serial
 
 # Core import
 from .. import parsers as parser
@@ -45,7 +45,8 @@ class C3000SyringePumpCommands(LabDeviceCommands):
     # Y-valves, 90°-valves and T-valves use IOBE-notation
     # 6-pos valves use I1..I6/O1..O6 notation (I - moves CW, O - moves CCW)
     # 3-pos distribution valves can use either IOBE or I1..I3/O1..O3 depending how they were configured (Uxx command)
-    VALVE_POSITIONS = (
+    # Kept as a set of strings, as positions are checked against the string arguments of valve commands
+    VALVE_POSITIONS = frozenset((
         "",  # This is to pass check when IOBE addressing is used and I or O is requested
         "1",
         "2",
@@ -53,7 +54,7 @@ class C3000SyringePumpCommands(LabDeviceCommands):
         "4",
         "5",
         "6",
-    )
+    ))
 
     # Valve types for Uxx command
     VALVE_TYPES = {
@@ -159,10 +160,19 @@ class C3000SyringePumpCommands(LabDeviceCommands):
         0b1011: "Plunger move not allowed! Check valve position.",
         0b1111: "Command overflow!"
     }
+    # Same error messages indexed by error code, None for codes not in the manual
+    ERROR_MESSAGES = tuple(map(ERROR_CODES.get, range(16)))
 
     # Default status - pump initialized, idle, no error
     DEFAULT_STATUS = "/0`1"
 
+    # Status byte bits
+    STATUS_IDLE_BIT = 1 << 5
+    STATUS_ERROR_MASK = 0b1111
+
+    # For how long in seconds the status from the last status query is considered valid
+    STATUS_VALIDITY_PERIOD = 0.05
+
     # ################### Control commands ###################################
 
     # ## Initialization commands ##
@@ -263,7 +273,7 @@ class C3000SyringePumpCommands(LabDeviceCommands):
     # Set backlash increments
     SET_BACK_INC = {"name": "K", "reply": {"type": str}}
     # Set acceleration/deceleration ramp slope
-    SET_RAMP_PLOPE = {"name": "L", "type": str, "check": {"values": RAMP_PLOPE_MODES.keys()}}
+    SET_RAMP_PLOPE = {"name": "L", "type": str, "check": {"values": RAMP_PLOPE_MODES.keys()}, "reply": {"type": str}}
     # Set start velocity (beginning of ramp)
     SET_START_VEL = {"name": "v", "type": int, "check": {"min": 1, "max": 8000}, "reply": {"type": str}}
     # Set maximum velocity (top of ramp) in increments/second
@@ -301,10 +311,11 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         self.cmd = C3000SyringePumpCommands
 
         # Check that valid valve type has been passed
-        try:
-            self._valve_type = C3000SyringePumpCommands.VALVE_TYPES[valve_type]
-        except KeyError:
-            raise PLDeviceError("Invalid valve type <{}> provided!".format(valve_type)) from None
+        self._valve_type = C3000SyringePumpCommands.VALVE_TYPES.get(valve_type)
+        if self._valve_type is None:
+            raise PLDeviceError("Invalid valve type <{}> provided!".format(valve_type))
+
+        import serial
 
         # Connection settings
         connection_parameters: ConnectionParameters = {}
@@ -319,13 +330,17 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         super().__init__(device_name, connection_mode, connection_parameters)
 
         # Set switch address
-        try:
-            switch_address = self.cmd.SWITCH_ADDRESSES[str(switch_address)]
-        except KeyError:
-            raise PLDeviceError("Invalid switch address <{}> supplied!".format(switch_address)) from None
+        # Switch positions above 9 are marked with hex digits A..E on the pump
+        if isinstance(switch_address, int):
+            switch_position = format(switch_address, "X")
+        else:
+            switch_position = str(switch_address)
+        address_code = self.cmd.SWITCH_ADDRESSES.get(switch_position)
+        if address_code is None:
+            raise PLDeviceError("Invalid switch address <{}> supplied!".format(switch_address))
 
         # Protocol settings
-        self.command_prefix = "/" + switch_address
+        self.command_prefix = "/" + address_code
         # Run commands after sending them to pump by default (R appended)
         self.command_terminator = self.cmd.PRG_RUN["name"] + "\r\n"
         self.reply_prefix = "/0"
@@ -333,6 +348,15 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         self.args_delimiter = ""
         # Pump status byte
         self._last_status = 0
+        # Idle flag and error code from the status byte
+        self._idle = False
+        self._error_code = 0
+        # Time of the last status query reply, None if any other command has been sent since
+        self._last_status_time: Optional[float] = None
+        # Firmware version read out by is_connected(), None if not read yet
+        self._fw_version: Optional[str] = None
+        # Pump configuration read out by get_pump_configuration(), None if not read yet
+        self._pump_configuration: Optional[str] = None
 
     @property
     def autorun(self):
@@ -359,13 +383,22 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
 
         # Strip reply terminator and prefix
         reply = parser.stripper(reply.body, self.reply_prefix, self.reply_terminator)
+        if not reply:
+            raise PLDeviceReplyError("No status byte in the pump reply!")
         # Then analyze status byte
         # Status byte is the 1st byte of reply string, & we need it's byte code.
         self._last_status = ord(reply[0])
+        # The rest is the actual reply
+        payload = reply[1:]
+        self._idle = self._last_status & self.cmd.STATUS_IDLE_BIT != 0
+        self._error_code = self._last_status & self.cmd.STATUS_ERROR_MASK
+        # Only the status query reply is reused by is_idle(),
+        # any other command might have changed the pump state
+        self._last_status_time = monotonic() if cmd is self.cmd.GET_STATUS else None
         self.check_errors()
-        self.logger.debug("parse_reply()::status byte checked, invoking parsing on <%s>", reply[1:])
-        # Chop off status byte & do standard processing
-        return super().parse_reply(cmd, reply[1:])
+        self.logger.debug("parse_reply()::status byte checked, invoking parsing on <%s>", payload)
+        # Do standard processing on the reply without status byte
+        return super().parse_reply(cmd, payload)
 
     def check_errors(self):
         """Checks error bits in the status byte of the pump reply.
@@ -373,30 +406,48 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
 
         self.logger.debug("check_errors()::checking errors on byte <%s>", self._last_status)
         # Error code is contained in 4 right-most bytes,
-        # so we need to chop off the rest
-        error_code = self._last_status & 0b1111
+        # it is extracted in parse_reply()
         # No error
-        if error_code == 0:
+        if self._error_code == 0:
             return None
-        try:
-            raise PLDeviceInternalError(self.cmd.ERROR_CODES[error_code])
-        except KeyError:
+        error_message = self.cmd.ERROR_MESSAGES[self._error_code]
+        if error_message is None:
             # This shouldn't really happen, means that pump replied with
             # error code not in the ERROR_CODES dictionary
             # (which completely copies the manual)
             raise PLDeviceReplyError("Unknown error! Status byte: {}".format(bin(self._last_status)))
+        raise PLDeviceInternalError(error_message)
+
+    def invalidate_cache(self):
+        """Drops the values read from the pump once and cached - firmware
+        version and pump configuration, so that they are read again on next request.
+        """
+
+        self._fw_version = None
+        self._pump_configuration = None
+
+    def disconnect(self):
+        """Disconnects from the device, dropping the cached pump data.
+        """
+
+        self.invalidate_cache()
+        super().disconnect()
 
     def is_connected(self) -> bool:
         """Checks whether the device is connected by
-        checking it's firmware version.
+        checking it's firmware version. The version is read only once
+        while the connection remains open.
         """
 
+        if self._fw_version is not None and self.connection.is_connection_open():
+            return True
         try:
             version = self.send(self.cmd.GET_FW_VER)
             self.logger.debug("is_connected()::Device connected; FW version <%s>", version)
-            return True
         except PLConnectionError:
             return False
+        self._fw_version = version
+        return True
 
     def get_status(self):
         """Not supported on this device.
@@ -433,6 +484,8 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         # last(I) and first(O) for CCW init
         for port in [input_port, output_port]:
             if port is not None:
+                # Port numbers can be passed as int as well
+                port = str(port)
                 if port not in self.cmd.VALVE_POSITIONS:
                     raise PLDeviceCommandError("Invalid port for initialization was provided!")
                 arglist.append(port)
@@ -463,13 +516,15 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """
 
         # Send status request command and read back reply with no parsing
-        # Parsing manipulates status byte to get error flags, we need it here
-        try:
-            _ = self.send(self.cmd.GET_STATUS)
-        except PLConnectionError:
-            return False
+        # Parsing manipulates status byte to get error flags, we need it here.
+        # If the pump status has just been queried, it is reused.
+        if self._last_status_time is None or monotonic() - self._last_status_time > self.cmd.STATUS_VALIDITY_PERIOD:
+            try:
+                _ = self.send(self.cmd.GET_STATUS)
+            except PLConnectionError:
+                return False
         # Busy/idle bit is 6th bit of the status byte. 0 - busy, 1 - idle
-        if self._last_status & 1 << 5 == 0:
+        if self._idle is False:
             self.logger.debug("is_idle()::false.")
             return False
         # Check for errors if any
@@ -641,22 +696,30 @@ class C3000SyringePump(AbstractSyringePump, AbstractDistributionValve):
         """Sets valve type. This command requires power-cycle to activate new settings!
         """
 
+        # Get correct valve code. Checked before asking for confirmation,
+        # so that an invalid valve type is reported straight away
+        valve_code = C3000SyringePumpCommands.VALVE_TYPES.get(valve_type)
+        if valve_code is None:
+            raise PLDeviceCommandError("Invalid valve type requested!")
         self.logger.warning("Changing the valve type would require power-cycling the pump!")
         if confirm is not True:
-            self.logger.info("Please, execute set_valve_type(valve_type, confirm=True)"
+            self.logger.info("Please, execute set_valve_type(valve_type, confirm=True) "
                              "to write new valve configuration to pump EEPROM.")
             return
-        try:
-            # Get correct valve code
-            self._valve_type = C3000SyringePumpCommands.VALVE_TYPES[valve_type]
-        except KeyError:
-            raise PLDeviceCommandError("Invalid valve type requested!")
         # Send command & check reply for errors
-        self.send(self.cmd.SET_PUMP_CONF, self._valve_type)
+        self.send(self.cmd.SET_PUMP_CONF, valve_code)
+        # Only update the valve type once the pump has accepted it
+        self._valve_type = valve_code
+        # Pump configuration has changed
+        self._pump_configuration = None
         self.logger.info("Valve type updated successfully. Don't forget to power-cycle the pump!")
 
     def get_pump_configuration(self):
-        """Reads pump EEPROM configuration.
+        """Reads pump EEPROM configuration. The configuration only changes
+        with set_valve_type(), so it is read from the pump once and cached.
         """
-        # Send command & check reply for errors
-        return self.send(self.cmd.GET_EEPROM_DATA)
+
+        if self._pump_configuration is None:
+            # Send command & check reply for errors
+            self._pump_configuration = self.send(self.cmd.GET_EEPROM_DATA)
+        return self._pump_configuration
@@ -4,8 +4,6 @@ import time
 from collections import OrderedDict
 from typing import Union, Optional, Dict, Any
 
-import serial
-
 # Core imports
 from .. import parsers as parser
 from ..controllers import AbstractPressureController, in_simulation_device_returns
@@ -204,6 +202,8 @@ class CVC3000VacuumPump(AbstractPressureController):
 
         self.cmd = CVC3000VacuumPumpCommands
 
+        import serial
+
         # Serial connection settings - p.105 of the manual
         connection_parameters: ConnectionParameters = {}
         connection_parameters["port"] = port
@@ -0,0 +1,64 @@
+"""PyLabware device discovery helpers."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+# How long bus enumeration results are reused, in seconds
+DISCOVERY_CACHE_TTL = 5.0
+
+# Enumeration results. Key - (bus type, hint), value - (timestamp, list of devices found)
+_cache: Dict[Tuple[str, Hashable], Tuple[float, List[Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+def enumerate_bus(bus: str, hint: Hashable = None, *, probe: Callable[[], List[Any]]) -> List[Any]:
+    """Enumerates devices on the bus, reusing the result of a previous
+    enumeration of the same bus if it is not older than DISCOVERY_CACHE_TTL.
+
+    Args:
+        bus: Bus type, e.g. "serial".
+        hint: Any additional key to distinguish different enumerations on the same bus.
+        probe: Function doing the actual enumeration and returning a list of devices found.
+
+    Returns:
+        (List): Devices found on the bus.
+    """
+
+    key = (bus, hint)
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < DISCOVERY_CACHE_TTL:
+        return list(hit[1])
+    # Probing might take a while, so it is done without holding the lock
+    now = time.monotonic()
+    devices = probe()
+    with _cache_lock:
+        _cache[key] = (now, tuple(devices))
+    return list(devices)
+
+
+def clear_cache():
+    """Drops all cached enumeration results, so that the next enumeration
+    would probe the bus again.
+    """
+
+    with _cache_lock:
+        _cache.clear()
+
+
+def _probe_serial_ports() -> List[str]:
+    """Lists the serial ports physically present in the system."""
+
+    from serial.tools import list_ports
+    return [port.device for port in list_ports.comports()]
+
+
+def scan() -> List[str]:
+    """Lists available serial ports. The result is cached for DISCOVERY_CACHE_TTL seconds.
+
+    Returns:
+        (List[str]): Serial port names.
+    """
+
+    return enumerate_bus("serial", probe=_probe_serial_ports)
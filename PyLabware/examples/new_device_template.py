@@ -1,9 +1,5 @@
 """PyLabware driver for NEW_DEVICE."""
 
-# You may want to import serial if the device is using serial connection and any
-# connection options (baudrate/parity/...) need to be changed
-# import serial
-
 # You would need appropriate abstract types from typing
 from typing import Optional, Union
 
@@ -65,6 +61,11 @@ class NEW_DEVICE(APPROPRIATE_ABSTRACT_DEVICE):
         # Load commands from helper class
         self.cmd = NEW_DEVICECommands
 
+        # You may want to import serial if the device is using serial connection and any
+        # connection options (baudrate/parity/...) need to be changed. Import it here rather
+        # than at module level to keep the package import cheap.
+        # import serial
+
         # Connection settings
         connection_parameters: ConnectionParameters = {}
         # Change any connection settings to device specific ones, if needed
@@ -0,0 +1,4 @@
+from .devices.heidolph_hei_torque_100_precision import HeiTorque100PrecisionStirrer
+from .devices.heidolph_rzr_2052_control import RZR2052ControlStirrer
+
+__all__ = ["HeiTorque100PrecisionStirrer", "RZR2052ControlStirrer"]
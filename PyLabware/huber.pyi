@@ -0,0 +1,3 @@
+from .devices.huber_petite_fleur import PetiteFleurChiller
+
+__all__ = ["PetiteFleurChiller"]
@@ -0,0 +1,3 @@
+from .devices.idex_mxii import IDEXMXIIValve
+
+__all__ = ["IDEXMXIIValve"]
@@ -0,0 +1,5 @@
+"""IKA devices, imported on first access."""
+
+from ._lazy import attach_vendor
+
+__getattr__, __dir__, __all__ = attach_vendor(__name__, "ika_")
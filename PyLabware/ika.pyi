@@ -0,0 +1,6 @@
+from .devices.ika_microstar_75 import Microstar75Stirrer
+from .devices.ika_rct_digital import RCTDigitalHotplate
+from .devices.ika_ret_control_visc import RETControlViscHotplate
+from .devices.ika_rv10 import RV10Rotovap
+
+__all__ = ["Microstar75Stirrer", "RCTDigitalHotplate", "RETControlViscHotplate", "RV10Rotovap"]
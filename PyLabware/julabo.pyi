@@ -0,0 +1,3 @@
+from .devices.julabo_cf41 import CF41Chiller
+
+__all__ = ["CF41Chiller"]
@@ -0,0 +1,3 @@
+from .devices.kern_kdp3000 import KDP3000Balance
+
+__all__ = ["KDP3000Balance"]
@@ -0,0 +1,3 @@
+from .devices.metrohm_781ph import Metrohm781pHMeter
+
+__all__ = ["Metrohm781pHMeter"]
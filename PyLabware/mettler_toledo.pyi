@@ -0,0 +1,3 @@
+from .devices.mt_ms3002s import MS3002SBalance
+
+__all__ = ["MS3002SBalance"]
@@ -39,11 +39,15 @@ def researcher(reply, *args):
 
     Args:
         reply: Reply to parse with regular expression.
+        args: Pattern string and optional flags for re.search(),
+              or a compiled pattern.
 
     Returns:
         (re.Match): Regular expression match object.
     """
 
+    if isinstance(args[0], re.Pattern):
+        return args[0].search(reply)
     return re.search(*args, reply)
 
 
@@ -62,11 +66,16 @@ def stripper(reply: str, prefix=None, suffix=None) -> str:
         (str): Naked reply.
     """
 
-    if prefix is not None and reply.startswith(prefix):
-        reply = reply[len(prefix):]
+    # Empty prefix/suffix are skipped as well - reply[:-0] would return an empty string
+    if prefix:
+        prefix_length = len(prefix)
+        if reply[:prefix_length] == prefix:
+            reply = reply[prefix_length:]
 
-    if suffix is not None and reply.endswith(suffix):
-        reply = reply[:-len(suffix)]
+    if suffix:
+        suffix_length = len(suffix)
+        if reply[-suffix_length:] == suffix:
+            reply = reply[:-suffix_length]
 
     return reply
 
@@ -79,5 +88,12 @@ def splitter(reply: str, separator: str, *slice_positions):
         separator (str): Sparator for str.split().
     """
 
-    reply = reply.split(separator)
+    # If only the last n parts are taken, e.g. (-2, -1) for the Mettler weight
+    # replies, split off just these from the end instead of splitting the whole string
+    start = slice_positions[0] if slice_positions else None
+    stop = slice_positions[1] if len(slice_positions) == 2 else None
+    if isinstance(start, int) and start < 0 and len(slice_positions) <= 2 and (stop is None or stop < 0):
+        reply = reply.rsplit(separator, -start)
+    else:
+        reply = reply.split(separator)
     return slicer(reply, *slice_positions)
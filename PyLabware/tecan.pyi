@@ -0,0 +1,3 @@
+from .devices.tecan_cavro_xlp6000 import XLP6000SyringePump
+
+__all__ = ["XLP6000SyringePump"]
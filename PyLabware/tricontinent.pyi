@@ -0,0 +1,3 @@
+from .devices.tricontinent_c3000 import C3000SyringePump
+
+__all__ = ["C3000SyringePump"]
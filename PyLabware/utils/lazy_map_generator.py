@@ -0,0 +1,61 @@
+"""Generates PyLabware/_lazy_map.py - the table of device classes and the
+driver modules providing them, used for lazy imports in PyLabware/__init__.py.
+
+Driver modules are scanned with the ast module, so nothing is imported.
+Every top-level class in PyLabware/devices/*.py which is not a
+LabDeviceCommands container is treated as a device class.
+"""
+
+import ast
+import os
+import sys
+
+PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEVICES_DIR = os.path.join(PACKAGE_DIR, "devices")
+OUTPUT_FILE = os.path.join(PACKAGE_DIR, "_lazy_map.py")
+
+HEADER = '''"""Device classes and the driver modules providing them.
+
+!!! THIS FILE IS AUTO-GENERATED BY utils/lazy_map_generator.py, DO NOT EDIT !!!
+"""
+
+'''
+
+
+def find_device_classes(devices_dir: str = DEVICES_DIR):
+    """Returns a list of (class name, relative module name) tuples for all
+    device classes found in the devices directory.
+    """
+
+    device_classes = []
+    for file_name in sorted(os.listdir(devices_dir)):
+        if not file_name.endswith(".py") or file_name.startswith("_"):
+            continue
+        with open(os.path.join(devices_dir, file_name), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=file_name)
+        module_name = ".devices." + file_name[:-3]
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+            if "LabDeviceCommands" in bases:
+                continue
+            device_classes.append((node.name, module_name))
+    return device_classes
+
+
+def generate(output_file: str = OUTPUT_FILE):
+    """Writes the lazy import table into the output file.
+    """
+
+    lines = [HEADER, "LAZY_MAP = {\n"]
+    for class_name, module_name in find_device_classes():
+        lines.append(f'    "{class_name}": "{module_name}",\n')
+    lines.append("}\n")
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+if __name__ == "__main__":
+    generate(sys.argv[1] if len(sys.argv) > 1 else OUTPUT_FILE)
+    print(f"Lazy import table written to {sys.argv[1] if len(sys.argv) > 1 else OUTPUT_FILE}")
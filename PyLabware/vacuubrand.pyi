@@ -0,0 +1,3 @@
+from .devices.vacuubrand_cvc_3000 import CVC3000VacuumPump
+
+__all__ = ["CVC3000VacuumPump"]
@@ -4,6 +4,11 @@
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+# Keep the configuration values below plain data (strings, lists, bools).
+# Sphinx pickles them to decide if the whole environment has to be re-read,
+# and values like functions don't compare equal between runs. Any code hooks
+# should be registered from a setup(app) function instead.
+
 # -- Path setup --------------------------------------------------------------
 
 # If extensions (or modules to document with autodoc) are in another directory,
@@ -25,16 +30,23 @@ author = 'Sergey Zalesskiy'
 
 # -- General configuration ---------------------------------------------------
 
+# Quick preview builds, set DOCS_FAST=1 in the environment to skip
+# the slow extensions when iterating on the docs
+DOCS_FAST = bool(os.environ.get("DOCS_FAST"))
+
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
     'sphinx.ext.autodoc',
-    'sphinx.ext.viewcode',
     'sphinx.ext.napoleon',
-    'sphinx_autodoc_typehints',
     'sphinx.ext.todo'
 ]
+# Resolving the type hints of every documented object and rendering
+# the highlighted source pages are the slowest parts of the build
+if not DOCS_FAST:
+    extensions.append('sphinx_autodoc_typehints')
+    extensions.append('sphinx.ext.viewcode')
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
@@ -49,7 +61,15 @@ language = 'en'
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+# The Makefile builds into the source directory itself, so its html/doctrees output
+# is excluded too. Caches are listed so that they never end up in the environment.
+exclude_patterns = ['_build', 'html', 'doctrees', 'Thumbs.db', '.DS_Store',
+                    '**/__pycache__', '**/.ipynb_checkpoints']
+
+# Don't convert quotes and dashes into their typographic forms. The docs are
+# mostly code and command strings, which should be shown exactly as typed.
+# This also skips a transform pass over every text node.
+smartquotes = False
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -71,8 +91,15 @@ html_logo = 'images/_static/logo_white_200px.png'
 # Include both class and __init__() docstring into class description
 autoclass_content = "both"
 
-# Show type hints in description of function/method
-autodoc_typehints = "description"
+# Show type hints in description of function/method, no type hints in quick preview builds
+autodoc_typehints = "none" if DOCS_FAST else "description"
+
+# -- Options for viewcode extension -----------------------------------------
+# Only link the source of the objects defined in the module itself,
+# not the ones imported into it
+viewcode_follow_imported_members = False
+# Source pages aren't needed in the e-book builds
+viewcode_enable_epub = False
 
 # -- Options for todo extension -------------------------------------------
 
@@ -7,7 +7,7 @@ setup(
     name=NAME,
     version=VERSION,
     install_requires=['pyserial>=3.3', 'pyyaml>=5.0', 'requests>=2.23'],
-    package_data={'PyLabware': ['manuals/*']},
+    package_data={'PyLabware': ['manuals/*', 'py.typed', '*.pyi']},
     include_package_data=True,
     packages=find_packages(),
     zip_safe=True,